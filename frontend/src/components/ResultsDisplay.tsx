@@ -1,6 +1,7 @@
 import React from 'react';
 import { BarChart3, TrendingUp, AlertCircle } from 'lucide-react';
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
+import { API_BASE_URL } from '../services/api';
 import type { SVRResult } from '../services/api';
 
 interface ResultsDisplayProps {
@@ -154,7 +155,7 @@ export const ResultsDisplay: React.FC<ResultsDisplayProps> = ({ result }) => {
               <CardContent>
                 <div className="w-full flex justify-center">
                   <img 
-                    src={plots.actual_vs_predicted} 
+                    src={`${API_BASE_URL}${plots.actual_vs_predicted}`}
                     alt="Actual vs Predicted Values Plot"
                     className="max-w-full h-auto rounded-lg border"
                     style={{ maxHeight: '500px' }}
@@ -173,7 +174,7 @@ export const ResultsDisplay: React.FC<ResultsDisplayProps> = ({ result }) => {
               <CardContent>
                 <div className="w-full flex justify-center">
                   <img 
-                    src={plots.residuals} 
+                    src={`${API_BASE_URL}${plots.residuals}`}
                     alt="Residuals Plot"
                     className="max-w-full h-auto rounded-lg border"
                     style={{ maxHeight: '500px' }}
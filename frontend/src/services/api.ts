@@ -1,6 +1,6 @@
 import axios from 'axios';
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+export const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 const API_PREFIX = import.meta.env.VITE_API_PREFIX || '/api/v1';
 
 const api = axios.create({
@@ -50,8 +50,8 @@ export interface SVRResult {
     feature_names: string[];
   };
   plots: {
-    actual_vs_predicted: any;
-    residuals: any;
+    actual_vs_predicted: string;
+    residuals: string;
   };
 }
 